@@ -8,9 +8,20 @@ Update selectors here as Twitter's DOM structure changes.
 # =============================================================================
 BROWSER_CONFIG = {
     "headless": False,
-    "slow_mo": 100,  # milliseconds between actions
+    "slow_mo": 0,  # milliseconds between actions (waits are condition-driven)
     "viewport": None,  # None = use full screen size
+    "headless_viewport": {"width": 800, "height": 1200},  # used after --headless relaunch
+    # Opt-in for headed runs: stop loading these once logged in (avatars etc.).
+    # Off by default because Playwright request routing disables the HTTP
+    # cache below and sends every request through Python. --headless already
+    # turns images off in Blink without routing.
+    "block_resources_when_headed": False,
+    # Stylesheets stay on since menu positioning and clicks depend on layout;
+    # API calls are never blocked.
+    "blocked_resource_types": ("image", "media", "font"),
     "user_data_dir": "./browser_data",  # Persistent session storage
+    "disk_cache_dir": "./browser_data/cache",  # HTTP cache kept between runs
+    "disk_cache_size": 256 * 1024 * 1024,  # bytes
     "start_maximized": True,  # Start browser maximized
 }
 
@@ -18,22 +29,44 @@ BROWSER_CONFIG = {
 # TIMING CONFIGURATION
 # =============================================================================
 DELAYS = {
-    "between_removals": 2.0,  # seconds between follower removals
-    "after_scroll": 1.5,  # seconds to wait after scrolling
-    "menu_animation": 0.5,  # seconds for menu to render
+    "after_scroll": 1.5,  # max seconds to wait for the list to settle after scrolling
+    "dom_quiet": 0.3,  # seconds without DOM changes that count as settled
+    "network_quiet": 0.4,  # seconds with no requests in flight that count as idle
+    "network_timeout": 3.0,  # max seconds to wait for the network to go idle
+    "menu_animation": 0.5,  # max seconds to wait for a menu/dialog to close
+    "removal_settle": 2.0,  # max seconds to wait for a removed follower's row to disappear
     "page_load": 3.0,  # seconds for page to load
-    "rate_limit_backoff": 60,  # seconds to wait on rate limit
     "login_check_interval": 2.0,  # seconds between login status checks
 }
 
+# =============================================================================
+# RATE LIMITING (see rate_limiter.py)
+# =============================================================================
+RATE_LIMIT = {
+    "actions_per_second": 1.0,  # sustained removal rate while Twitter isn't pushing back
+    "min_actions_per_second": 0.1,  # floor when many responses are 429s
+    "ewma_alpha": 0.2,  # weight of the newest response in the 429-rate average
+    "base_backoff": 2.0,  # seconds to pause after the first 429
+    "max_backoff": 300.0,  # cap on exponential backoff
+    "jitter": 0.1,  # +/- fraction applied to every backoff
+}
+
 # =============================================================================
 # LIMITS & SAFETY
 # =============================================================================
 LIMITS = {
     "max_removals_per_session": 1000,
     "max_retry_attempts": 3,
+    "circuit_breaker_failures": 3,  # consecutive failed removals before resetting the page
     "max_scroll_attempts": 150,  # prevent infinite scrolling
-    "batch_size": 10,  # followers to process before brief pause
+    "batch_size": 10,  # followers per progress update / rate limiter burst size
+    # Removals in flight at once. The caret menu and confirm sheet are
+    # page-global, so >1 can click "Remove" in another cell's menu - only
+    # raise this if each removal gets its own page.
+    "removal_concurrency": 1,
+    # Removals attempted per in-page batch (rows must already be rendered;
+    # the rest fall back to the scroll-and-find path one at a time)
+    "removal_batch_size": 5,
 }
 
 # =============================================================================
@@ -85,7 +118,7 @@ URLS = {
 # BOT DETECTION PATTERNS
 # =============================================================================
 BOT_DETECTION = {
-    # Usernames ending with 3+ consecutive digits
+    # Usernames ending with 5+ consecutive digits
     "digit_suffix_pattern": r".*\d{5,}$",
     # Optional: Additional patterns can be added here
     "suspicious_patterns": [
@@ -109,6 +142,9 @@ OUTPUT = {
     "reports_dir": "./reports",
     "screenshots_dir": "./screenshots",
     "backup_dir": "./backups",
+    "cache_dir": "./cache",  # known non-bot followers, reused across runs
     "log_file": "./twitter_cleaner.log",
+    "screenshot_format": "jpeg",  # "jpeg" (small, fast to encode) or "png" (lossless)
+    "screenshot_quality": 70,  # JPEG quality, ignored for PNG
 }
 
@@ -3,7 +3,7 @@
 Twitter Follower Cleanup Tool - Entry Point
 
 Automates the removal of suspected bot followers from a Twitter/X account.
-Identifies potential bot accounts (usernames ending with 3+ digits) and removes them.
+Identifies potential bot accounts (usernames ending with 5+ digits) and removes them.
 
 Usage:
     python main.py --user-id <username> [options]
@@ -21,8 +21,8 @@ from pathlib import Path
 # Ensure project root is in path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils import setup_logging, print_banner
-from twitter_cleaner import TwitterCleaner
+# utils/twitter_cleaner are imported inside main_async so --help and
+# --version don't pay for loading Playwright
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -85,6 +85,12 @@ Safety Notes:
         help="Start scanning from the end of the followers list (older followers first)",
     )
     
+    parser.add_argument(
+        "--api-scan",
+        action="store_true",
+        help="Read the followers list from X's API responses instead of the page, removing bots as each response arrives",
+    )
+    
     parser.add_argument(
         "--verbose",
         "-v",
@@ -92,6 +98,18 @@ Safety Notes:
         help="Enable detailed debug logging",
     )
     
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Also save the followers list as CSV alongside the JSON report",
+    )
+    
+    parser.add_argument(
+        "--rescan",
+        action="store_true",
+        help="Ignore followers cached as non-bots by earlier runs and classify everyone",
+    )
+    
     parser.add_argument(
         "--yes",
         "-y",
@@ -118,6 +136,9 @@ async def main_async(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
+    from utils import setup_logging, print_banner
+    from twitter_cleaner import TwitterCleaner
+    
     # Setup logging
     logger = setup_logging(verbose=args.verbose)
     
@@ -127,12 +148,15 @@ async def main_async(args: argparse.Namespace) -> int:
     # Log configuration
     logger.info("=" * 50)
     logger.info("Configuration:")
-    logger.info(f"  User ID:     @{args.user_id}")
-    logger.info(f"  Mode:        {'DRY RUN' if args.dry_run else 'LIVE'}")
-    logger.info(f"  Limit:       {args.limit} followers")
-    logger.info(f"  From End:    {args.from_end}")
-    logger.info(f"  Verbose:     {args.verbose}")
-    logger.info(f"  Auto-confirm:{args.yes}")
+    logger.info("  User ID:     @%s", args.user_id)
+    logger.info("  Mode:        %s", 'DRY RUN' if args.dry_run else 'LIVE')
+    logger.info("  Limit:       %s followers", args.limit)
+    logger.info("  From End:    %s", args.from_end)
+    logger.info("  API Scan:    %s", args.api_scan)
+    logger.info("  Rescan:      %s", args.rescan)
+    logger.info("  CSV Report:  %s", args.csv)
+    logger.info("  Verbose:     %s", args.verbose)
+    logger.info("  Auto-confirm:%s", args.yes)
     logger.info("=" * 50)
     
     if not args.dry_run and not args.yes:
@@ -143,14 +167,17 @@ async def main_async(args: argparse.Namespace) -> int:
         async with TwitterCleaner(
             user_id=args.user_id,
             headless=args.headless,
-            verbose=args.verbose
+            verbose=args.verbose,
+            use_cache=not args.rescan
         ) as cleaner:
             
             report = await cleaner.run(
                 dry_run=args.dry_run,
                 limit=args.limit,
                 skip_confirmation=args.yes,
-                from_end=args.from_end
+                from_end=args.from_end,
+                api_scan=args.api_scan,
+                write_csv=args.csv
             )
             
             # Return success if no errors
@@ -161,7 +188,7 @@ async def main_async(args: argparse.Namespace) -> int:
         return 130
         
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         if args.verbose:
             import traceback
             traceback.print_exc()
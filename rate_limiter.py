@@ -0,0 +1,158 @@
+"""
+Adaptive rate limiting for Twitter Follower Cleanup Tool.
+Paces removals with a token bucket and backs off when Twitter pushes back.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from config import LIMITS, RATE_LIMIT
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = RATE_LIMIT["base_backoff"],
+    cap: float = RATE_LIMIT["max_backoff"],
+    jitter: float = RATE_LIMIT["jitter"]
+) -> float:
+    """
+    Exponential backoff with jitter.
+    
+    Args:
+        attempt: Number of consecutive failures so far (0 for the first)
+        base: Delay in seconds for the first attempt
+        cap: Maximum delay in seconds before jitter
+        jitter: Relative jitter, e.g. 0.1 for +/-10%
+    
+    Returns:
+        Delay in seconds
+    """
+    delay = min(cap, base * 2 ** attempt)
+    return delay * random.uniform(1 - jitter, 1 + jitter)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+    
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+    
+    Returns:
+        Seconds to wait, or None if missing/unparseable
+    """
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Token bucket whose refill rate adapts to observed rate limiting.
+    
+    The bucket holds up to `capacity` actions and refills at `rate` actions per
+    second, scaled down by an EWMA of the share of responses that were 429s.
+    An explicit 429 blocks all actions for an exponential backoff (or the
+    server's Retry-After, whichever is longer).
+    
+    Usage:
+        limiter = RateLimiter()
+        await limiter.acquire()        # before each action
+        limiter.on_response(429, "30")  # for each observed API response
+    """
+    
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT["actions_per_second"],
+        capacity: int = LIMITS["batch_size"]
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        
+        # EWMA of 429 responses (0.0 = none, 1.0 = every response limited)
+        self.limited_rate = 0.0
+        self.consecutive_limited = 0
+        
+        self._blocked_until = 0.0
+        self._last_refill = time.monotonic()
+    
+    @property
+    def current_rate(self) -> float:
+        """Refill rate after adapting to recent rate limiting."""
+        return max(RATE_LIMIT["min_actions_per_second"], self.rate * (1 - self.limited_rate))
+    
+    def _refill(self, now: float):
+        """Add the tokens earned since the last refill."""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.current_rate)
+    
+    async def acquire(self):
+        """Wait until an action is allowed, then consume one token."""
+        while True:
+            now = time.monotonic()
+            
+            if now < self._blocked_until:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+            
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            
+            await asyncio.sleep((1 - self.tokens) / self.current_rate)
+    
+    def on_response(self, status: int, retry_after: Optional[str] = None) -> float:
+        """
+        Record an API response and back off if it was rate limited.
+        
+        Args:
+            status: HTTP status code
+            retry_after: Raw Retry-After header value, if any
+        
+        Returns:
+            Seconds until actions are allowed again (0.0 if not blocked)
+        """
+        limited = status == 429
+        alpha = RATE_LIMIT["ewma_alpha"]
+        self.limited_rate = alpha * limited + (1 - alpha) * self.limited_rate
+        
+        now = time.monotonic()
+        if not limited:
+            self.consecutive_limited = 0
+            return max(0.0, self._blocked_until - now)
+        
+        server_delay = parse_retry_after(retry_after)
+        if now < self._blocked_until:
+            # Part of a burst we're already backing off from - don't escalate
+            delay = server_delay or 0.0
+        else:
+            delay = backoff_delay(self.consecutive_limited)
+            if server_delay is not None:
+                delay = max(delay, server_delay)
+            self.consecutive_limited += 1
+        
+        self.tokens = 0.0
+        self._blocked_until = max(self._blocked_until, now + delay)
+        # Earn nothing while blocked, or the bucket refills to a full burst
+        # the moment the block ends
+        self._last_refill = max(self._last_refill, self._blocked_until)
+        return self._blocked_until - now
@@ -5,20 +5,284 @@ Handles browser automation for removing bot followers.
 
 import asyncio
 import logging
+import re
+import time
 from datetime import datetime
-from typing import List, Optional, Set
-from dataclasses import asdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
 
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, ElementHandle, TimeoutError as PlaywrightTimeout
 
 from config import BROWSER_CONFIG, DELAYS, LIMITS, SELECTORS, TEXT_PATTERNS, URLS
+from rate_limiter import RateLimiter, backoff_delay
 from utils import (
     FollowerInfo, CleanupReport, 
-    is_bot_username, extract_username_from_text,
-    save_report, save_backup, print_summary, format_progress, confirm_action
+    classify_batch, extract_username_from_text,
+    save_report, save_backup, print_summary, format_progress, confirm_action_async,
+    load_known_good, save_known_good
 )
 
 
+# Present only once the user is logged in
+_LOGGED_IN_SELECTOR = f'{SELECTORS["profile_button"]}, {SELECTORS["home_timeline"]}'
+
+# Candidate selectors for a cell's "More" (caret) menu button, best first
+_MENU_BUTTON_SELECTORS = (
+    SELECTORS["more_menu_button"],
+    '[aria-label="More"]',
+    '[data-testid="userActions"]',
+    'button[aria-haspopup="menu"]',
+    '[role="button"][aria-haspopup="menu"]',
+)
+_MENU_BUTTON_SELECTOR_GROUP = ", ".join(_MENU_BUTTON_SELECTORS)
+
+# Menu item text for "Remove follower", matched case-insensitively in the page
+_REMOVE_FOLLOWER_TEXT = re.compile(
+    "|".join(re.escape(text) for text in (
+        TEXT_PATTERNS["remove_follower"],
+        TEXT_PATTERNS["remove_follower_alt"],
+    )),
+    re.IGNORECASE
+)
+
+# Top-level X paths that can show up as profile-style links but aren't users
+_RESERVED = frozenset({
+    "home", "explore", "notifications", "messages", "i", "settings",
+    "compose", "search", "logout", "login", "signup", "account", "intent",
+    "share", "hashtag", "bookmarks", "lists", "communities", "jobs",
+    "premium", "verified-choose", "tos", "privacy", "about", "download",
+})
+
+# Reads [href, display name] for follower cells not returned by an earlier
+# call, tagging each cell with the href it was read for. The list is
+# virtualized and React may reuse a node for another user, so a cell counts
+# as new whenever its href differs from the tag, not just when it's untagged.
+_READ_CELLS_JS = """
+([cellSel, linkSel, nameSel]) => {
+    const rows = [];
+    for (const cell of document.querySelectorAll(cellSel)) {
+        const link = cell.querySelector(linkSel);
+        const href = link ? link.getAttribute('href') : null;
+        if (href === null || cell.dataset.cleanerSeen === href) continue;
+        cell.dataset.cleanerSeen = href;
+        const name = cell.querySelector(nameSel);
+        rows.push([href, name ? name.innerText : '']);
+    }
+    return rows;
+}
+"""
+
+# True once any follower cell shows an href _READ_CELLS_JS hasn't tagged it
+# with. The list is virtualized, so the cell count plateaus while scrolling
+# and can't be used as the "new cells arrived" signal.
+_HAS_UNREAD_CELL_JS = """
+([cellSel, linkSel]) => Array.from(document.querySelectorAll(cellSel)).some(cell => {
+    const link = cell.querySelector(linkSel);
+    const href = link ? link.getAttribute('href') : null;
+    return href !== null && cell.dataset.cleanerSeen !== href;
+})
+"""
+
+# Resolves true once document.body has gone quietMs without child-list
+# mutations, or false if that doesn't happen within timeoutMs
+_DOM_STABLE_JS = """
+([quietMs, timeoutMs]) => new Promise(resolve => {
+    let quietTimer = null;
+    let deadline = null;
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    });
+    const finish = settled => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve(settled);
+    };
+    observer.observe(document.body, {childList: true, subtree: true});
+    quietTimer = setTimeout(() => finish(true), quietMs);
+    deadline = setTimeout(() => finish(false), timeoutMs);
+})
+"""
+
+# True once no follower cell's profile link points at the given
+# (lowercase) username, i.e. the row for a removed follower is gone
+_ROW_GONE_JS = """
+([cellSel, linkSel, username]) => !Array.from(document.querySelectorAll(cellSel)).some(cell => {
+    const link = cell.querySelector(linkSel);
+    const href = link && link.getAttribute('href');
+    return href && href.replace(/^\\/+/, '').split('/')[0].toLowerCase() === username;
+})
+"""
+
+# Removes each listed (lowercase) username whose row is rendered, entirely
+# in the page: open the row's caret menu, click the "Remove follower" item,
+# confirm, and wait for the row to detach. Returns
+# {username: {removed, detached}}. Rows that aren't rendered or don't behave
+# come back with removed false so the caller can fall back to the
+# step-by-step path.
+_BATCH_REMOVE_JS = """
+async ([cellSel, linkSel, menuBtnSel, menuItemSel, confirmSel, removeTexts, usernames, timeoutMs]) => {
+    const waitFor = (probe, timeout) => new Promise(resolve => {
+        const hit = probe();
+        if (hit) return resolve(hit);
+        const observer = new MutationObserver(() => {
+            const value = probe();
+            if (value) finish(value);
+        });
+        const timer = setTimeout(() => finish(null), timeout);
+        function finish(value) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(value);
+        }
+        observer.observe(document.body, {childList: true, subtree: true});
+    });
+    const findCell = username => {
+        for (const cell of document.querySelectorAll(cellSel)) {
+            const link = cell.querySelector(linkSel);
+            const href = link && link.getAttribute('href');
+            if (href && href.replace(/^\\/+/, '').split('/')[0].toLowerCase() === username) return cell;
+        }
+        return null;
+    };
+    const findRemoveItem = () => Array.from(document.querySelectorAll(menuItemSel)).find(
+        item => removeTexts.some(text => item.innerText.toLowerCase().includes(text))
+    );
+
+    const results = {};
+    for (const username of usernames) {
+        results[username] = {removed: false, detached: false};
+        const cell = findCell(username);
+        const menuButton = cell && cell.querySelector(menuBtnSel);
+        if (!menuButton) continue;
+
+        menuButton.scrollIntoView({block: 'center'});
+        menuButton.click();
+        const item = await waitFor(findRemoveItem, timeoutMs);
+        if (!item) {
+            document.body.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', bubbles: true}));
+            continue;
+        }
+        item.click();
+
+        // Same as the Python path: a missing confirm sheet isn't a failure
+        const confirm = await waitFor(() => document.querySelector(confirmSel), timeoutMs);
+        if (confirm) confirm.click();
+        results[username].removed = true;
+        results[username].detached = Boolean(await waitFor(() => !findCell(username), timeoutMs));
+    }
+    return results;
+}
+"""
+
+# Keeps scrolling to the bottom, waiting for the DOM to settle after each
+# scroll, until the height is unchanged for stableRounds settled rounds with
+# no spinner showing. Gives up early (end: false) when a Retry button shows
+# up so the caller can recover, or after maxRounds scrolls.
+_SCROLL_TO_END_JS = """
+async ([spinnerSel, quietMs, timeoutMs, stableRounds, maxRounds]) => {
+    const settle = () => new Promise(resolve => {
+        let quietTimer = null;
+        const observer = new MutationObserver(() => {
+            clearTimeout(quietTimer);
+            quietTimer = setTimeout(finish, quietMs);
+        });
+        const deadline = setTimeout(finish, timeoutMs);
+        function finish() {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(deadline);
+            resolve();
+        }
+        observer.observe(document.body, {childList: true, subtree: true});
+        quietTimer = setTimeout(finish, quietMs);
+    });
+    const hasRetry = () => Array.from(
+        document.querySelectorAll('button, [role="button"]')
+    ).some(b => b.innerText.trim() === 'Retry');
+
+    let lastHeight = 0;
+    let stable = 0;
+    for (let round = 0; round < maxRounds; round++) {
+        window.scrollTo(0, document.body.scrollHeight);
+        await settle();
+        const height = document.body.scrollHeight;
+        if (height !== lastHeight) {
+            lastHeight = height;
+            stable = 0;
+        } else if (hasRetry()) {
+            return {end: false, h: height};
+        } else if (!document.querySelector(spinnerSel) && ++stable >= stableRounds) {
+            return {end: true, h: height};
+        }
+    }
+    return {end: false, h: lastHeight};
+}
+"""
+
+# Maps lowercase username -> follower cell for the requested usernames,
+# matching on each cell's first profile link just like the reader above
+_FIND_CELLS_JS = """
+([cellSel, linkSel, usernames]) => {
+    const wanted = new Set(usernames);
+    const found = Object.create(null);
+    for (const cell of document.querySelectorAll(cellSel)) {
+        const link = cell.querySelector(linkSel);
+        const href = link && link.getAttribute('href');
+        if (!href) continue;
+        const username = href.replace(/^\\/+/, '').split('/')[0].toLowerCase();
+        if (wanted.has(username) && !(username in found)) found[username] = cell;
+    }
+    return found;
+}
+"""
+
+
+def _username_from_href(href: str) -> str:
+    """Return the first path segment of a root-relative href ("/name/..." -> "name")."""
+    end = href.find("/", 1)
+    return href[1:end] if end > 0 else href[1:]
+
+
+def _profile_username(href: Optional[str]) -> Optional[str]:
+    """Username a profile link points at, or None if it isn't a user profile."""
+    if not href or href == "/":
+        return None
+    
+    # Extract username from href (format: /{username})
+    username = _username_from_href(href)
+    if not username or username in _RESERVED:
+        return None
+    return username
+
+
+def _dig(obj, *keys) -> dict:
+    """Follow nested dict keys, treating missing keys, nulls and non-dicts as {}."""
+    for key in keys:
+        obj = obj.get(key) if isinstance(obj, dict) else None
+    return obj if isinstance(obj, dict) else {}
+
+
+def _iter_followers_payload(payload: dict):
+    """
+    Yield (screen_name, display_name) for every user in a Followers GraphQL response.
+    
+    Handles both the older layout (user_results.result.legacy.screen_name)
+    and the newer one (user_results.result.core.screen_name). Missing or
+    null fields anywhere in the payload just skip that entry.
+    """
+    timeline = _dig(payload, "data", "user", "result", "timeline", "timeline")
+    for instruction in timeline.get("instructions") or []:
+        for entry in _dig(instruction).get("entries") or []:
+            result = _dig(entry, "content", "itemContent", "user_results", "result")
+            legacy = _dig(result, "legacy")
+            core = _dig(result, "core")
+            screen_name = legacy.get("screen_name") or core.get("screen_name")
+            if screen_name:
+                yield screen_name, legacy.get("name") or core.get("name") or ""
+
+
 class TwitterCleaner:
     """
     Main class for cleaning bot followers from Twitter/X account.
@@ -32,7 +296,8 @@ class TwitterCleaner:
         self, 
         user_id: str,
         headless: bool = False,
-        verbose: bool = False
+        verbose: bool = False,
+        use_cache: bool = True
     ):
         self.user_id = user_id
         self.headless_after_login = headless
@@ -47,15 +312,37 @@ class TwitterCleaner:
         # Tracking
         self.scanned_usernames: Set[str] = set()
         self.followers: List[FollowerInfo] = []
+        self._bot_followers: List[FollowerInfo] = []  # the is_bot subset of followers, in order
         self.removed_count = 0
         self.failed_count = 0
         
-        # Report
+        # Followers already classified as non-bots on earlier runs
+        self.known_good: Set[str] = load_known_good(user_id) if use_cache else set()
+        
+        # Paces removals and backs off on 429s seen in API responses
+        self.rate_limiter = RateLimiter()
+        self._removal_sem = asyncio.Semaphore(LIMITS["removal_concurrency"])
+        self._menu_selector_cache: Optional[str] = None
+        # Set by remove_follower when the user wasn't in the list at all
+        self._last_removal_not_found = False
+        
+        # In-flight request IDs from the page's CDP Network domain
+        self._inflight: Set[str] = set()
+        self._last_network_activity = 0.0
+        self._cdp = None
+        
+        # Report; session duration is measured on the monotonic clock
+        self._session_t0 = time.monotonic()
         self.report = CleanupReport(
             session_start=datetime.now().isoformat(),
             user_id=user_id
         )
     
+    @property
+    def bot_count(self) -> int:
+        """Number of followers identified as bots so far."""
+        return len(self._bot_followers)
+    
     async def __aenter__(self):
         """Async context manager entry."""
         await self.initialize_browser()
@@ -63,31 +350,67 @@ class TwitterCleaner:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        self._save_scan_cache()
         await self.cleanup()
     
-    async def initialize_browser(self):
-        """Initialize Playwright browser with persistent context."""
-        self.logger.info("Initializing browser (fullscreen mode)...")
+    def _save_scan_cache(self):
+        """Remember this run's non-bot followers so the next run can skip classifying them."""
+        if not self.followers:
+            return
+        
+        known_good = self.known_good.union(f.username for f in self.followers if not f.is_bot)
+        try:
+            path = save_known_good(self.user_id, known_good)
+            self.logger.debug("Scan cache saved: %s (%s usernames)", path, len(known_good))
+        except OSError as e:
+            self.logger.warning("Could not save scan cache: %s", e)
+    
+    async def initialize_browser(self, headless: bool = False):
+        """
+        Initialize Playwright browser with persistent context.
         
-        self.playwright = await async_playwright().start()
+        Args:
+            headless: Launch headless with a small viewport and images off.
+                The first launch is always headed so the user can log in.
+        """
+        mode = "headless mode" if headless else "fullscreen mode"
+        self.logger.info("Initializing browser (%s)...", mode)
         
-        # Browser args for maximized/fullscreen
+        if not self.playwright:
+            self.playwright = await async_playwright().start()
+        
+        # Rendering-cost flags, plus a pinned, sized disk cache so x.com's
+        # JS bundles stay warm from one run to the next
         browser_args = [
             '--disable-blink-features=AutomationControlled',
             '--no-sandbox',
-            '--start-maximized',
+            '--disable-gpu',
+            '--disable-dev-shm-usage',
+            '--disable-extensions',
+            '--disable-features=TranslateUI,BackForwardCache',
+            f'--disk-cache-dir={BROWSER_CONFIG["disk_cache_dir"]}',
+            f'--disk-cache-size={BROWSER_CONFIG["disk_cache_size"]}',
         ]
+        if headless:
+            # Avatars are useless for username-based detection; login (which
+            # may show a captcha) always happens headed with images on
+            browser_args.append('--blink-settings=imagesEnabled=false')
+        else:
+            browser_args.append('--start-maximized')
         
         # Build context options
         context_options = {
             "user_data_dir": BROWSER_CONFIG["user_data_dir"],
-            "headless": False,  # Always start non-headless for login
+            "headless": headless,
             "slow_mo": BROWSER_CONFIG["slow_mo"],
             "args": browser_args,
+            "bypass_csp": False,  # keep service workers / cache storage usable
         }
         
+        if headless:
+            context_options["viewport"] = BROWSER_CONFIG["headless_viewport"]
         # Use no_viewport for fullscreen (viewport fills entire window)
-        if BROWSER_CONFIG.get("start_maximized", True):
+        elif BROWSER_CONFIG.get("start_maximized", True):
             context_options["no_viewport"] = True
         elif BROWSER_CONFIG.get("viewport"):
             context_options["viewport"] = BROWSER_CONFIG["viewport"]
@@ -101,7 +424,83 @@ class TwitterCleaner:
         else:
             self.page = await self.context.new_page()
         
-        self.logger.info("Browser initialized successfully (fullscreen)")
+        # Feed API responses to the rate limiter
+        self.context.on("response", self._on_response)
+        
+        # Accept native confirm()/alert() dialogs so they can't stall a removal
+        self.page.on("dialog", self._on_dialog)
+        
+        await self._attach_network_tracker()
+        
+        self.logger.info("Browser initialized successfully (%s)", mode)
+    
+    async def _attach_network_tracker(self):
+        """Track the page's in-flight requests over CDP for _wait_for_network_quiet."""
+        self._inflight.clear()
+        self._last_network_activity = time.monotonic()
+        try:
+            self._cdp = await self.context.new_cdp_session(self.page)
+            self._cdp.on("Network.requestWillBeSent", self._on_request_sent)
+            self._cdp.on("Network.loadingFinished", self._on_request_done)
+            self._cdp.on("Network.loadingFailed", self._on_request_done)
+            await self._cdp.send("Network.enable")
+        except Exception as e:
+            self.logger.debug("Network tracking unavailable: %s", e)
+            self._cdp = None
+    
+    def _on_request_sent(self, event: dict):
+        """CDP Network.requestWillBeSent handler."""
+        # Long-lived streams never finish and would keep the page "busy" forever
+        if event.get("type") in ("EventSource", "WebSocket"):
+            return
+        self._inflight.add(event["requestId"])
+        self._last_network_activity = time.monotonic()
+    
+    def _on_request_done(self, event: dict):
+        """CDP Network.loadingFinished / loadingFailed handler."""
+        if event["requestId"] in self._inflight:
+            self._inflight.discard(event["requestId"])
+            self._last_network_activity = time.monotonic()
+    
+    async def _relaunch_headless(self):
+        """Reopen the persistent context headless, reusing the saved login session."""
+        self.logger.info("Relaunching browser headless for the rest of the session...")
+        await self.context.close()
+        await self.initialize_browser(headless=True)
+    
+    async def _after_login(self):
+        """Prepare the browser for scanning once login is confirmed."""
+        if self.headless_after_login:
+            # Images are already off in headless mode
+            await self._relaunch_headless()
+        elif BROWSER_CONFIG["block_resources_when_headed"]:
+            # Trades the warm HTTP cache (routing disables it) for not
+            # downloading avatars and media
+            await self.context.route("**/*", self._route_handler)
+    
+    async def _route_handler(self, route):
+        """Abort requests for resources username-based detection never needs."""
+        if route.request.resource_type in BROWSER_CONFIG["blocked_resource_types"]:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    def _on_response(self, response):
+        """Report Twitter API responses to the rate limiter."""
+        if "/i/api/" not in response.url:
+            return
+        
+        wait = self.rate_limiter.on_response(response.status, response.headers.get("retry-after"))
+        if response.status == 429:
+            self.logger.warning("Rate limited by Twitter - pausing removals for %.0fs", wait)
+    
+    async def _on_dialog(self, dialog):
+        """Accept a native browser dialog."""
+        self.logger.debug("Accepting %s dialog: %s", dialog.type, dialog.message)
+        try:
+            await dialog.accept()
+        except Exception as e:
+            self.logger.debug("Could not accept dialog: %s", e)
     
     async def cleanup(self):
         """Clean up browser resources."""
@@ -132,6 +531,7 @@ class TwitterCleaner:
         # Check if already logged in
         if await self._is_logged_in():
             self.logger.info("✓ Already logged in!")
+            await self._after_login()
             return True
         
         # Prompt user to log in
@@ -142,8 +542,45 @@ class TwitterCleaner:
         print("  The script will continue automatically once login is detected.")
         print("\n" + "=" * 60 + "\n")
         
-        # Wait for login with periodic checks
+        # Wait for either logged-in marker to appear - a single selector wait,
+        # with a separate task logging the time remaining
         max_wait_time = 300  # 5 minutes
+        started = time.monotonic()
+        heartbeat = asyncio.create_task(self._log_login_wait(max_wait_time))
+        
+        try:
+            await self.page.wait_for_selector(_LOGGED_IN_SELECTOR, timeout=max_wait_time * 1000)
+            logged_in = True
+        except PlaywrightTimeout:
+            logged_in = False
+        except Exception as e:
+            # e.g. the page context was torn down mid-wait; poll for the rest
+            self.logger.debug("Login wait interrupted (%s) - falling back to polling", e)
+            logged_in = await self._poll_for_login(max_wait_time - (time.monotonic() - started))
+        finally:
+            heartbeat.cancel()
+        
+        if logged_in:
+            self.logger.info("✓ Login detected!")
+            await self._after_login()
+            return True
+        
+        self.logger.error("Login timeout - please try again")
+        return False
+    
+    async def _log_login_wait(self, max_wait_time: float):
+        """Log the remaining login wait every 30 seconds."""
+        for elapsed in range(30, int(max_wait_time), 30):
+            await asyncio.sleep(30)
+            self.logger.info("Still waiting for login... (%ss remaining)", int(max_wait_time - elapsed))
+    
+    async def _poll_for_login(self, max_wait_time: float) -> bool:
+        """
+        Poll for login until it's detected or max_wait_time seconds pass.
+        
+        Returns:
+            True if login detected, False on timeout
+        """
         elapsed = 0
         
         while elapsed < max_wait_time:
@@ -151,32 +588,24 @@ class TwitterCleaner:
             elapsed += DELAYS["login_check_interval"]
             
             if await self._is_logged_in():
-                self.logger.info("✓ Login detected!")
                 return True
-            
-            if elapsed % 30 == 0:
-                self.logger.info(f"Still waiting for login... ({int(max_wait_time - elapsed)}s remaining)")
         
-        self.logger.error("Login timeout - please try again")
         return False
     
     async def _is_logged_in(self) -> bool:
         """Check if user is currently logged in."""
         try:
-            # Look for profile button in sidebar (indicates logged in)
-            profile_btn = await self.page.query_selector(SELECTORS["profile_button"])
-            if profile_btn:
-                return True
-            
-            # Alternative: Check for home timeline
-            timeline = await self.page.query_selector(SELECTORS["home_timeline"])
-            if timeline:
-                return True
-            
-            return False
+            # Profile button in sidebar or home timeline, in one query
+            return await self.page.query_selector(_LOGGED_IN_SELECTOR) is not None
         except Exception:
             return False
     
+    def _on_followers_page(self) -> bool:
+        """Whether the page is currently showing this user's followers list."""
+        url = URLS["followers_template"].format(user_id=self.user_id)
+        current = self.page.url.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+        return current.lower() == url.lower()
+    
     async def navigate_to_followers(self) -> bool:
         """
         Navigate to the followers page for the specified user.
@@ -185,7 +614,7 @@ class TwitterCleaner:
             True if navigation successful, False otherwise
         """
         url = URLS["followers_template"].format(user_id=self.user_id)
-        self.logger.info(f"Navigating to followers page: {url}")
+        self.logger.info("Navigating to followers page: %s", url)
         
         for attempt in range(LIMITS["max_retry_attempts"]):
             try:
@@ -208,12 +637,12 @@ class TwitterCleaner:
                 return True
                 
             except PlaywrightTimeout:
-                self.logger.warning(f"Timeout loading followers (attempt {attempt + 1})")
+                self.logger.warning("Timeout loading followers (attempt %s)", attempt + 1)
                 if attempt < LIMITS["max_retry_attempts"] - 1:
                     await self._handle_page_error()
                     await asyncio.sleep(2)
             except Exception as e:
-                self.logger.error(f"Failed to navigate to followers: {e}")
+                self.logger.error("Failed to navigate to followers: %s", e)
                 if attempt < LIMITS["max_retry_attempts"] - 1:
                     await asyncio.sleep(2)
         
@@ -253,7 +682,7 @@ class TwitterCleaner:
                 
             return False
         except Exception as e:
-            self.logger.debug(f"Error handling page error: {e}")
+            self.logger.debug("Error handling page error: %s", e)
             return False
     
     async def scroll_and_collect_followers(self, limit: Optional[int] = None) -> List[FollowerInfo]:
@@ -272,38 +701,43 @@ class TwitterCleaner:
         no_new_followers_count = 0
         collected_limit = limit or float('inf')
         
+        # Bound once; the per-follower loop below is the hot path
+        scanned_usernames = self.scanned_usernames
+        followers = self.followers
+        logger = self.logger
+        verbose = self.verbose
+        
         while scroll_count < LIMITS["max_scroll_attempts"]:
-            # Get all visible follower cells
-            cells = await self.page.query_selector_all(SELECTORS["follower_cell"])
+            # Read newly rendered follower cells in one round-trip
+            visible = await self._read_visible_followers()
             
             new_followers_found = 0
             
-            for cell in cells:
-                if len(self.followers) >= collected_limit:
+            for follower in visible:
+                if len(followers) >= collected_limit:
                     break
                 
-                follower = await self._extract_follower_info(cell)
-                
-                if follower and follower.username not in self.scanned_usernames:
-                    self.scanned_usernames.add(follower.username)
-                    self.followers.append(follower)
+                if follower.username not in scanned_usernames:
+                    scanned_usernames.add(follower.username)
+                    followers.append(follower)
                     new_followers_found += 1
                     
                     if follower.is_bot:
-                        self.logger.info(f"  🤖 Bot detected: @{follower.username} - {follower.bot_reason}")
-                    elif self.verbose:
-                        self.logger.debug(f"  ✓ Scanned: @{follower.username}")
+                        self._bot_followers.append(follower)
+                        logger.info("  🤖 Bot detected: @%s - %s", follower.username, follower.bot_reason)
+                    elif verbose:
+                        logger.debug("  ✓ Scanned: @%s", follower.username)
             
             # Update progress
-            bot_count = sum(1 for f in self.followers if f.is_bot)
             self.logger.info(
-                f"Progress: {len(self.followers)} scanned, {bot_count} bots found "
-                f"{format_progress(len(self.followers), collected_limit if limit else len(self.followers) + 50)}"
+                "Progress: %s scanned, %s bots found %s",
+                len(self.followers), self.bot_count,
+                format_progress(len(self.followers), collected_limit if limit else len(self.followers) + 50)
             )
             
             # Check if we've reached limit
             if len(self.followers) >= collected_limit:
-                self.logger.info(f"Reached scan limit of {limit}")
+                self.logger.info("Reached scan limit of %s", limit)
                 break
             
             # Check if we found any new followers
@@ -317,23 +751,142 @@ class TwitterCleaner:
             
             # Scroll down to load more
             await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(DELAYS["after_scroll"])
             
             # Wait for new content to load
-            try:
-                await self.page.wait_for_selector(
-                    SELECTORS["loading_spinner"],
-                    state="hidden",
-                    timeout=5000
-                )
-            except PlaywrightTimeout:
-                pass  # Spinner might not appear
+            await self._wait_for_unread_cells()
             
             scroll_count += 1
         
-        self.logger.info(f"✓ Scan complete: {len(self.followers)} followers, {sum(1 for f in self.followers if f.is_bot)} bots identified")
+        self.logger.info("✓ Scan complete: %s followers, %s bots identified", len(self.followers), self.bot_count)
         return self.followers
 
+    async def scan_via_api(
+        self,
+        limit: Optional[int] = None,
+        dry_run: bool = True,
+        removal_limit: Optional[int] = None,
+        require_confirmation: bool = True
+    ) -> List[FollowerInfo]:
+        """
+        Collect followers from the Followers GraphQL responses the page fetches.
+        
+        Instead of reading rendered cells, this listens for the JSON the
+        followers page loads and scrolls only to make it request the next
+        page of results. Unless dry_run is set, the bots from each response
+        are removed right after it arrives, while their rows are the ones
+        just rendered at the bottom of the list.
+        
+        Args:
+            limit: Maximum number of followers to collect
+            dry_run: If True, only identify bots without removing
+            removal_limit: Maximum number of removals
+            require_confirmation: If True, ask before first removal
+            
+        Returns:
+            List of FollowerInfo objects
+        """
+        self.logger.info("Starting to scan followers via API responses...")
+        
+        collected_limit = limit or float('inf')
+        removal_limit = removal_limit or LIMITS["max_removals_per_session"]
+        first_removal = True
+        handler = self._on_followers_response
+        self.page.on("response", handler)
+        
+        try:
+            # (Re)load the page with the listener attached so the first
+            # batch of followers is captured too
+            if not await self.navigate_to_followers():
+                return self.followers
+            
+            scroll_count = 0
+            no_new_followers_count = 0
+            bots_handled = 0
+            
+            while True:
+                # Bots from the responses since the last pass
+                batch_bots = self._bot_followers[bots_handled:]
+                bots_handled = len(self._bot_followers)
+                
+                if batch_bots and not dry_run:
+                    confirm = first_removal and require_confirmation
+                    first_removal = False
+                    dry_run = not await self._remove_rendered_bots(batch_bots, removal_limit, confirm)
+                
+                if not dry_run and self.removed_count >= removal_limit:
+                    self.logger.info("Reached removal limit of %s", removal_limit)
+                    break
+                
+                if len(self.followers) >= collected_limit:
+                    self.logger.info("Reached scan limit of %s", limit)
+                    break
+                
+                if scroll_count >= LIMITS["max_scroll_attempts"]:
+                    break
+                
+                before = len(self.followers)
+                
+                # Scrolling to the bottom makes the page fetch the next cursor;
+                # what we're waiting on is that fetch, not the DOM
+                await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await self._wait_for_network_quiet()
+                
+                if len(self.followers) == before:
+                    no_new_followers_count += 1
+                    if no_new_followers_count >= 3:
+                        self.logger.info("No more followers to load")
+                        break
+                else:
+                    no_new_followers_count = 0
+                
+                self.logger.info(
+                    "Progress: %s scanned, %s bots, %s removed, %s failed",
+                    len(self.followers), self.bot_count, self.removed_count, self.failed_count
+                )
+                
+                scroll_count += 1
+        finally:
+            self.page.remove_listener("response", handler)
+        
+        if limit and len(self.followers) > limit:
+            # The last response can overshoot the limit by up to a page
+            del self.followers[limit:]
+            self._bot_followers = [f for f in self.followers if f.is_bot]
+        
+        self.logger.info(
+            "✓ Scan complete: %s followers, %s bots identified, %s removed, %s failed",
+            len(self.followers), self.bot_count, self.removed_count, self.failed_count
+        )
+        return self.followers
+    
+    async def _on_followers_response(self, response):
+        """Record followers from a Followers GraphQL response."""
+        # .../graphql/<queryId>/Followers - not FollowersYouKnow etc.
+        operation = urlsplit(response.url).path.rsplit("/", 1)[-1]
+        if operation != "Followers" or response.status != 200:
+            return
+        
+        try:
+            payload = await response.json()
+        except Exception as e:
+            self.logger.debug("Could not parse Followers response: %s", e)
+            return
+        
+        new_rows = []
+        for username, display_name in _iter_followers_payload(payload):
+            if username not in self.scanned_usernames:
+                self.scanned_usernames.add(username)
+                new_rows.append((username, display_name))
+        
+        for follower in self._make_followers(new_rows):
+            self.followers.append(follower)
+            
+            if follower.is_bot:
+                self._bot_followers.append(follower)
+                self.logger.info("  🤖 Bot detected: @%s - %s", follower.username, follower.bot_reason)
+            elif self.verbose:
+                self.logger.debug("  ✓ Scanned: @%s", follower.username)
+    
     async def scan_and_remove_in_batches(
         self, 
         dry_run: bool = False,
@@ -366,78 +919,56 @@ class TwitterCleaner:
         removal_limit = limit or LIMITS["max_removals_per_session"]
         first_removal = True
         
+        # Bound once; the per-follower loop below is the hot path
+        scanned_usernames = self.scanned_usernames
+        followers = self.followers
+        logger = self.logger
+        verbose = self.verbose
+        
         while scroll_count < LIMITS["max_scroll_attempts"]:
             # Check for page errors
             if await self._handle_page_error():
                 await asyncio.sleep(2)
             
-            # Get all visible follower cells
-            cells = await self.page.query_selector_all(SELECTORS["follower_cell"])
+            # Read newly rendered follower cells in one round-trip
+            visible = await self._read_visible_followers()
             
             # If from_end, process cells in reverse order
             if from_end:
-                cells = list(reversed(cells))
+                visible.reverse()
             
             new_followers_found = 0
             batch_bots = []
             
             # Scan visible cells
-            for cell in cells:
-                follower = await self._extract_follower_info(cell)
-                
-                if follower and follower.username not in self.scanned_usernames:
-                    self.scanned_usernames.add(follower.username)
-                    self.followers.append(follower)
+            for follower in visible:
+                if follower.username not in scanned_usernames:
+                    scanned_usernames.add(follower.username)
+                    followers.append(follower)
                     new_followers_found += 1
                     
                     if follower.is_bot:
-                        self.logger.info(f"  🤖 Bot detected: @{follower.username} - {follower.bot_reason}")
-                        batch_bots.append((follower, cell))
-                    elif self.verbose:
-                        self.logger.debug(f"  ✓ Scanned: @{follower.username}")
+                        self._bot_followers.append(follower)
+                        logger.info("  🤖 Bot detected: @%s - %s", follower.username, follower.bot_reason)
+                        batch_bots.append(follower)
+                    elif verbose:
+                        logger.debug("  ✓ Scanned: @%s", follower.username)
             
             # Process bot removals for this batch
             if batch_bots and not dry_run:
-                # First time confirmation
-                if first_removal and require_confirmation:
-                    bot_count = len([f for f in self.followers if f.is_bot])
-                    print(f"\n  Found {bot_count} bots so far. First batch has {len(batch_bots)} bots.")
-                    if not confirm_action("Start removing bots as they're found?"):
-                        self.logger.info("Removal cancelled - continuing in dry-run mode")
-                        dry_run = True
-                    else:
-                        first_removal = False
-                
-                if not dry_run:
-                    for follower, cell in batch_bots:
-                        if self.removed_count >= removal_limit:
-                            self.logger.info(f"Reached removal limit of {removal_limit}")
-                            break
-                        
-                        self.logger.info(f"  Removing @{follower.username}...")
-                        success = await self._remove_follower_from_cell(cell, follower.username)
-                        
-                        if success:
-                            follower.removed = True
-                            self.removed_count += 1
-                            self.logger.info(f"  ✓ Removed @{follower.username} ({self.removed_count}/{removal_limit})")
-                        else:
-                            follower.removal_error = "Failed to remove"
-                            self.failed_count += 1
-                            self.logger.warning(f"  ✗ Failed to remove @{follower.username}")
-                        
-                        await asyncio.sleep(DELAYS["between_removals"])
+                confirm = first_removal and require_confirmation
+                first_removal = False
+                dry_run = not await self._remove_rendered_bots(batch_bots, removal_limit, confirm)
             
             # Check if reached removal limit
             if self.removed_count >= removal_limit:
-                self.logger.info(f"Reached removal limit of {removal_limit}")
+                self.logger.info("Reached removal limit of %s", removal_limit)
                 break
             
             # Update progress
-            bot_count = sum(1 for f in self.followers if f.is_bot)
             self.logger.info(
-                f"Progress: {len(self.followers)} scanned, {bot_count} bots, "
-                f"{self.removed_count} removed, {self.failed_count} failed"
+                "Progress: %s scanned, %s bots, %s removed, %s failed",
+                len(self.followers), self.bot_count, self.removed_count, self.failed_count
             )
             
             # Check if we found any new followers
@@ -456,43 +987,194 @@ class TwitterCleaner:
             else:
                 # Scroll down to load more recent followers
                 await self.page.evaluate("window.scrollBy(0, 600)")
-            await asyncio.sleep(DELAYS["after_scroll"])
+            
+            # The DOM can go quiet while the next page is still in flight,
+            # so wait for rows we haven't read rather than for a settled DOM
+            await self._wait_for_unread_cells()
             
             scroll_count += 1
         
         self.logger.info(
-            f"✓ Complete: {len(self.followers)} scanned, "
-            f"{sum(1 for f in self.followers if f.is_bot)} bots identified, "
-            f"{self.removed_count} removed, {self.failed_count} failed"
+            "✓ Complete: %s scanned, %s bots identified, %s removed, %s failed",
+            len(self.followers), self.bot_count, self.removed_count, self.failed_count
         )
         
         return self.removed_count
 
-    async def _scroll_to_end_of_list(self):
-        """Scroll to the end of the followers list."""
-        self.logger.info("Scrolling to end of list...")
+    async def _remove_rendered_bots(
+        self,
+        batch_bots: List[FollowerInfo],
+        removal_limit: int,
+        confirm: bool = False
+    ) -> bool:
+        """
+        Remove a batch of just-found bots while their rows are still rendered.
         
-        last_height = 0
-        same_height_count = 0
+        Args:
+            batch_bots: Bots found in the latest batch
+            removal_limit: Session removal limit
+            confirm: If True, ask before removing (the first batch)
+            
+        Returns:
+            False if the user declined removal, True otherwise
+        """
+        if confirm:
+            print(f"\n  Found {self.bot_count} bots so far. First batch has {len(batch_bots)} bots.")
+            if not await confirm_action_async("Start removing bots as they're found?"):
+                self.logger.info("Removal cancelled - continuing in dry-run mode")
+                return False
         
-        while same_height_count < 5:
-            # Scroll to bottom
-            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(1.5)
+        # Element handles only for the bots, looked up by username
+        bot_cells = await self._find_cells([f.username for f in batch_bots])
+        remaining = removal_limit - self.removed_count
+        
+        await asyncio.gather(*(
+            self._remove_one(follower, bot_cells.get(follower.username.lower()), removal_limit)
+            for follower in batch_bots[:remaining]
+        ))
+        return True
+    
+    async def _scroll_to_top(self):
+        """Scroll to the top of the list and wait until the first rows are there."""
+        await self.page.evaluate("window.scrollTo(0, 0)")
+        try:
+            await self.page.wait_for_function("window.scrollY === 0", timeout=2000)
+            await self.page.wait_for_selector(SELECTORS["follower_cell"], timeout=2000)
+        except PlaywrightTimeout:
+            self.logger.debug("List not ready after scrolling to top")
+    
+    async def _wait_for_unread_cells(self, timeout_ms: int = 5000) -> bool:
+        """
+        Wait until a follower cell we haven't read yet is rendered.
+        
+        Returns as soon as the first unread cell mounts; the rest are picked
+        up by the next read.
+        
+        Args:
+            timeout_ms: Maximum time to wait
             
-            # Check for page errors
-            if await self._handle_page_error():
-                await asyncio.sleep(2)
+        Returns:
+            True if an unread cell appeared, False on timeout (which the
+            caller's next read then counts as empty)
+        """
+        try:
+            await self.page.wait_for_function(
+                _HAS_UNREAD_CELL_JS,
+                arg=[SELECTORS["follower_cell"], SELECTORS["user_name_link"]],
+                timeout=timeout_ms
+            )
+            return True
+        except PlaywrightTimeout:
+            return False
+    
+    async def _wait_for_network_quiet(
+        self,
+        quiet: float = DELAYS["network_quiet"],
+        timeout: float = DELAYS["network_timeout"]
+    ) -> bool:
+        """
+        Wait until the page has had no requests in flight for a while.
+        
+        Falls back to _wait_for_dom_stable if CDP network tracking isn't available.
+        
+        Args:
+            quiet: Seconds with nothing in flight that count as idle
+            timeout: Maximum seconds to wait
             
-            # Get new height
-            new_height = await self.page.evaluate("document.body.scrollHeight")
+        Returns:
+            True if the network went idle, False on timeout
+        """
+        if not self._cdp:
+            return await self._wait_for_dom_stable()
+        
+        start = time.monotonic()
+        deadline = start + timeout
+        while True:
+            now = time.monotonic()
+            # Count quiet time from the call too, so a request triggered by
+            # the scroll we just did has a chance to start
+            idle_since = max(self._last_network_activity, start)
+            if not self._inflight and now - idle_since >= quiet:
+                return True
+            if now >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+    
+    async def _wait_for_dom_stable(
+        self,
+        quiet_ms: int = int(DELAYS["dom_quiet"] * 1000),
+        timeout_ms: int = int(DELAYS["after_scroll"] * 1000)
+    ) -> bool:
+        """
+        Wait until the page stops adding/removing nodes after a scroll.
+        
+        Args:
+            quiet_ms: How long the DOM must go without changes
+            timeout_ms: Maximum time to wait
+            
+        Returns:
+            True if the DOM settled, False on timeout or evaluation error
+        """
+        try:
+            return await self.page.evaluate(_DOM_STABLE_JS, [quiet_ms, timeout_ms])
+        except Exception as e:
+            # e.g. navigation destroyed the context mid-wait
+            self.logger.debug("DOM stability wait failed: %s", e)
+            return False
+    
+    async def _remove_one(self, follower: FollowerInfo, cell: Optional[ElementHandle], removal_limit: int):
+        """
+        Remove one bot from its cell while holding a removal slot.
+        
+        Args:
+            follower: Bot to remove
+            cell: The bot's UserCell element handle, or None if no longer rendered
+            removal_limit: Session removal limit
+        """
+        async with self._removal_sem:
+            if self.removed_count >= removal_limit:
+                return
+            
+            if cell:
+                await self.rate_limiter.acquire()
+                self.logger.info("  Removing @%s...", follower.username)
+                success = await self._remove_follower_from_cell(cell, follower.username)
+            else:
+                self.logger.debug("Cell for @%s is no longer rendered", follower.username)
+                success = False
             
-            if new_height == last_height:
-                same_height_count += 1
+            # No await between read and write, so these updates can't interleave
+            if success:
+                follower.removed = True
+                self.removed_count += 1
+                self.logger.info("  ✓ Removed @%s (%s/%s)", follower.username, self.removed_count, removal_limit)
             else:
-                same_height_count = 0
-                last_height = new_height
-                self.logger.debug(f"  Scrolling... (height: {new_height})")
+                follower.removal_error = "Failed to remove"
+                self.failed_count += 1
+                self.logger.warning("  ✗ Failed to remove @%s", follower.username)
+    
+    async def _scroll_to_end_of_list(self):
+        """Scroll to the end of the followers list."""
+        self.logger.info("Scrolling to end of list...")
+        
+        # The scroll/settle/measure loop runs in the page; we only come back
+        # out to recover from X's "Something went wrong" error state
+        while True:
+            result = await self.page.evaluate(_SCROLL_TO_END_JS, [
+                SELECTORS["loading_spinner"],
+                int(DELAYS["dom_quiet"] * 1000),
+                int(DELAYS["after_scroll"] * 1000),
+                5,
+                LIMITS["max_scroll_attempts"],
+            ])
+            self.logger.debug("  Scrolled to height %s", result['h'])
+            
+            if result["end"]:
+                break
+            if not await self._handle_page_error():
+                self.logger.warning("Stopped scrolling before the list stopped growing")
+                return
+            await asyncio.sleep(2)
         
         self.logger.info("✓ Reached end of followers list")
 
@@ -508,49 +1190,27 @@ class TwitterCleaner:
             True if removal successful, False otherwise
         """
         try:
-            # Scroll cell into view
+            # Scroll cell into view (waits for the cell to stop moving)
             await cell.scroll_into_view_if_needed()
-            await asyncio.sleep(0.3)
-            
-            # Try multiple selectors for the menu button
-            more_btn = None
-            menu_selectors = [
-                '[data-testid="caret"]',
-                '[aria-label="More"]',
-                '[data-testid="userActions"]',
-                'button[aria-haspopup="menu"]',
-            ]
-            
-            for selector in menu_selectors:
-                more_btn = await cell.query_selector(selector)
-                if more_btn:
-                    break
             
-            # Fallback: find any button with "more" in aria-label
-            if not more_btn:
-                buttons = await cell.query_selector_all('button')
-                for btn in buttons:
-                    aria_label = await btn.get_attribute('aria-label')
-                    if aria_label and 'more' in aria_label.lower():
-                        more_btn = btn
-                        break
+            more_btn = await self._find_menu_button(cell)
             
             if not more_btn:
-                self.logger.debug(f"Could not find menu button for @{username}")
+                self.logger.debug("Could not find menu button for @%s", username)
                 return False
             
+            # No fixed sleeps here: _find_remove_button waits for the menu and
+            # _handle_confirmation_dialog waits for the confirm sheet
             await more_btn.click()
-            await asyncio.sleep(DELAYS["menu_animation"])
             
             # Find and click "Remove follower" option
             remove_btn = await self._find_remove_button()
             if not remove_btn:
                 await self.page.keyboard.press("Escape")
-                self.logger.debug(f"Could not find remove option for @{username}")
+                self.logger.debug("Could not find remove option for @%s", username)
                 return False
             
             await remove_btn.click()
-            await asyncio.sleep(DELAYS["menu_animation"])
             
             # Handle confirmation dialog
             await self._handle_confirmation_dialog()
@@ -558,57 +1218,96 @@ class TwitterCleaner:
             return True
             
         except Exception as e:
-            self.logger.debug(f"Error removing @{username}: {e}")
+            self.logger.debug("Error removing @%s: %s", username, e)
             try:
                 await self.page.keyboard.press("Escape")
             except:
                 pass
             return False
     
-    async def _extract_follower_info(self, cell) -> Optional[FollowerInfo]:
+    async def _read_visible_followers(self) -> List[FollowerInfo]:
+        """
+        Read newly rendered follower cells with a single page evaluation.
+        
+        Cells already returned by a previous call are skipped in the page, so
+        each scroll only transfers and classifies the rows it brought in.
+        
+        Returns:
+            FollowerInfo for each new cell with a usable profile link, in page order
+        """
+        try:
+            rows = await self.page.evaluate(
+                _READ_CELLS_JS,
+                [SELECTORS["follower_cell"], SELECTORS["user_name_link"], SELECTORS["user_name_span"]]
+            )
+        except Exception as e:
+            self.logger.debug("Failed to read follower cells: %s", e)
+            return []
+        
+        profiles = []
+        for href, display_name in rows:
+            username = _profile_username(href)
+            if username:
+                profiles.append((username, display_name))
+        return self._make_followers(profiles)
+    
+    async def _find_cells(self, usernames: List[str]) -> Dict[str, ElementHandle]:
         """
-        Extract follower information from a UserCell element.
+        Look up the rendered cells for specific followers in one evaluation.
         
         Args:
-            cell: Playwright element handle for the follower cell
+            usernames: Usernames to find
             
         Returns:
-            FollowerInfo object or None if extraction fails
+            Dict of lowercase username -> cell element handle (missing if not rendered)
         """
         try:
-            # Try to find username from the profile link
-            link = await cell.query_selector(SELECTORS["user_name_link"])
-            if not link:
-                return None
-            
-            href = await link.get_attribute("href")
-            if not href or href == "/":
-                return None
-            
-            # Extract username from href (format: /{username})
-            username = href.strip("/").split("/")[0]
-            if not username or username in ("home", "explore", "notifications", "messages"):
-                return None
-            
-            # Try to get display name
-            display_name = ""
-            name_span = await cell.query_selector(SELECTORS["user_name_span"])
-            if name_span:
-                display_name = await name_span.inner_text()
-            
-            # Check if bot
-            is_bot, reason = is_bot_username(username)
-            
-            return FollowerInfo(
+            found = await self.page.evaluate_handle(
+                _FIND_CELLS_JS,
+                [SELECTORS["follower_cell"], SELECTORS["user_name_link"], [u.lower() for u in usernames]]
+            )
+            properties = await found.get_properties()
+        except Exception as e:
+            self.logger.debug("Failed to look up follower cells: %s", e)
+            return {}
+        
+        return {
+            username: handle.as_element()
+            for username, handle in properties.items()
+            if handle.as_element()
+        }
+    
+    def _make_followers(self, rows: Iterable[Tuple[str, str]]) -> List[FollowerInfo]:
+        """
+        Build and classify FollowerInfo objects for a batch of users.
+        
+        Args:
+            rows: (username, display_name) pairs
+            
+        Returns:
+            FollowerInfo for each row, in order
+        """
+        rows = list(rows)
+        
+        # Followers cached as non-bots by an earlier run skip classification
+        known_good = self.known_good
+        to_classify = [username for username, _ in rows if username not in known_good]
+        verdicts = dict(zip(to_classify, classify_batch(to_classify)))
+        
+        # One timestamp for the whole batch - they were all read together
+        scanned_at = datetime.now().isoformat()
+        
+        followers = []
+        for username, display_name in rows:
+            is_bot, reason = verdicts.get(username, (False, ""))
+            followers.append(FollowerInfo(
                 username=username,
                 display_name=display_name,
                 is_bot=is_bot,
-                bot_reason=reason
-            )
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to extract follower info: {e}")
-            return None
+                bot_reason=reason,
+                timestamp=scanned_at
+            ))
+        return followers
     
     async def _find_user_cell(self, username: str, max_scrolls: int = 15) -> Optional[any]:
         """
@@ -621,11 +1320,12 @@ class TwitterCleaner:
         Returns:
             Element handle for the user cell, or None
         """
-        username_lower = username.lower()
+        # Matches "/username" exactly or followed by a further path segment
+        target = "/" + username.lower()
+        target_len = len(target)
         
         # First scroll to top
-        await self.page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(0.5)
+        await self._scroll_to_top()
         
         for scroll_attempt in range(max_scrolls):
             # Check for page errors first
@@ -644,10 +1344,11 @@ class TwitterCleaner:
                     link = await cell.query_selector(SELECTORS["user_name_link"])
                     if link:
                         href = await link.get_attribute("href")
-                        if href and href.strip("/").split("/")[0].lower() == username_lower:
+                        if href and href.lower().startswith(target) and (
+                            len(href) == target_len or href[target_len] == "/"
+                        ):
                             # Scroll element into view
                             await cell.scroll_into_view_if_needed()
-                            await asyncio.sleep(0.5)
                             return cell
                 except Exception:
                     continue
@@ -668,7 +1369,8 @@ class TwitterCleaner:
         Returns:
             True if removal successful, False otherwise
         """
-        self.logger.info(f"Attempting to remove @{username}...")
+        self.logger.info("Attempting to remove @%s...", username)
+        self._last_removal_not_found = False
         
         for attempt in range(LIMITS["max_retry_attempts"]):
             try:
@@ -676,79 +1378,98 @@ class TwitterCleaner:
                 target_cell = await self._find_user_cell(username)
                 
                 if not target_cell:
-                    self.logger.warning(f"Could not find @{username} after scrolling")
+                    self.logger.warning("Could not find @%s after scrolling", username)
+                    self._last_removal_not_found = True
                     return False
                 
-                # Try multiple selectors for the menu button
-                more_btn = None
-                menu_selectors = [
-                    '[data-testid="caret"]',
-                    '[aria-label="More"]',
-                    '[data-testid="userActions"]',
-                    'button[aria-haspopup="menu"]',
-                    '[role="button"][aria-haspopup="menu"]',
-                ]
-                
-                for selector in menu_selectors:
-                    more_btn = await target_cell.query_selector(selector)
-                    if more_btn:
-                        self.logger.debug(f"Found menu button with selector: {selector}")
-                        break
-                
-                if not more_btn:
-                    # Try finding any button in the cell
-                    buttons = await target_cell.query_selector_all('button')
-                    for btn in buttons:
-                        aria_label = await btn.get_attribute('aria-label')
-                        if aria_label and 'more' in aria_label.lower():
-                            more_btn = btn
-                            break
+                more_btn = await self._find_menu_button(target_cell)
                 
                 if not more_btn:
-                    self.logger.warning(f"Could not find menu button for @{username}")
+                    self.logger.warning("Could not find menu button for @%s", username)
                     if attempt < LIMITS["max_retry_attempts"] - 1:
                         await asyncio.sleep(1)
                         continue
                     return False
                 
                 await more_btn.click()
-                await asyncio.sleep(DELAYS["menu_animation"])
                 
                 # Find and click "Remove follower" option
                 remove_btn = await self._find_remove_button()
                 if not remove_btn:
                     # Close menu if open
                     await self.page.keyboard.press("Escape")
-                    self.logger.warning(f"Could not find remove option for @{username}")
+                    self.logger.warning("Could not find remove option for @%s", username)
                     return False
                 
                 await remove_btn.click()
-                await asyncio.sleep(DELAYS["menu_animation"])
                 
                 # Handle confirmation dialog if present
                 await self._handle_confirmation_dialog()
                 
-                self.logger.info(f"✓ Successfully removed @{username}")
+                self.logger.info("✓ Successfully removed @%s", username)
                 return True
                 
             except PlaywrightTimeout:
-                self.logger.warning(f"Timeout on attempt {attempt + 1} for @{username}")
+                self.logger.warning("Timeout on attempt %s for @%s", attempt + 1, username)
                 if attempt < LIMITS["max_retry_attempts"] - 1:
-                    await asyncio.sleep(DELAYS["rate_limit_backoff"] / 10)
+                    await asyncio.sleep(backoff_delay(attempt))
                     
             except Exception as e:
-                self.logger.error(f"Error removing @{username}: {e}")
+                self.logger.error("Error removing @%s: %s", username, e)
                 if attempt < LIMITS["max_retry_attempts"] - 1:
                     await asyncio.sleep(1)
         
         return False
     
+    async def _find_menu_button(self, cell) -> Optional[ElementHandle]:
+        """
+        Find the "More" (caret) menu button inside a user cell.
+        
+        Args:
+            cell: The UserCell element handle
+            
+        Returns:
+            Element handle for the button, or None
+        """
+        # The selector that matched last time almost always matches again
+        if self._menu_selector_cache:
+            more_btn = await cell.query_selector(self._menu_selector_cache)
+            if more_btn:
+                return more_btn
+        
+        # All candidates in a single query, then remember which one hit
+        more_btn = await cell.query_selector(_MENU_BUTTON_SELECTOR_GROUP)
+        if more_btn:
+            self._menu_selector_cache = await more_btn.evaluate(
+                "(el, selectors) => selectors.find(s => el.matches(s)) || null",
+                list(_MENU_BUTTON_SELECTORS)
+            )
+            return more_btn
+        
+        # Fallback: find any button with "more" in aria-label, in one round-trip
+        handle = await cell.evaluate_handle(
+            """el => Array.from(el.querySelectorAll('button')).find(
+                b => (b.getAttribute('aria-label') || '').toLowerCase().includes('more')
+            ) || null"""
+        )
+        more_btn = handle.as_element()
+        if not more_btn:
+            await handle.dispose()
+        return more_btn
+    
     async def _find_remove_button(self):
         """Find the 'Remove follower' button in the dropdown menu."""
         try:
-            # Wait for menu to appear
-            await self.page.wait_for_selector(SELECTORS["menu_item"], timeout=3000)
-            
+            # Waits for the menu and matches the text in the page, in one call
+            item = self.page.locator(SELECTORS["menu_item"]).filter(has_text=_REMOVE_FOLLOWER_TEXT).first
+            return await item.element_handle(timeout=3000)
+        except PlaywrightTimeout:
+            # Menu may be up with differently worded items - check them below
+            pass
+        except Exception:
+            return None
+        
+        try:
             # Get all menu items
             menu_items = await self.page.query_selector_all(SELECTORS["menu_item"])
             
@@ -772,20 +1493,22 @@ class TwitterCleaner:
     async def _handle_confirmation_dialog(self):
         """Handle any confirmation dialog that appears."""
         try:
-            # Check for confirmation dialog
-            confirm_btn = await self.page.wait_for_selector(
-                SELECTORS["confirm_button"],
-                timeout=2000
+            # X's confirmation is a DOM sheet, not a native dialog; the
+            # locator click waits for it to appear and become actionable
+            confirm_btn = self.page.locator(SELECTORS["confirm_button"])
+            await confirm_btn.click(timeout=2000)
+            
+            # Wait for the sheet to close rather than a fixed animation delay
+            await confirm_btn.wait_for(
+                state="hidden",
+                timeout=DELAYS["menu_animation"] * 1000
             )
-            if confirm_btn:
-                await confirm_btn.click()
-                await asyncio.sleep(DELAYS["menu_animation"])
-                
+            
         except PlaywrightTimeout:
             # No confirmation dialog - that's fine
             pass
         except Exception as e:
-            self.logger.debug(f"Confirmation dialog handling: {e}")
+            self.logger.debug("Confirmation dialog handling: %s", e)
     
     async def process_bot_removals(
         self, 
@@ -804,7 +1527,7 @@ class TwitterCleaner:
         Returns:
             Number of successfully removed followers
         """
-        bot_followers = [f for f in self.followers if f.is_bot]
+        bot_followers = self._bot_followers
         
         if not bot_followers:
             self.logger.info("No bot accounts identified - nothing to remove")
@@ -838,66 +1561,160 @@ class TwitterCleaner:
         
         # Confirmation
         if require_confirmation:
-            if not confirm_action(f"\nProceed with removing {len(bots_to_process)} bot followers?"):
+            if not await confirm_action_async(f"\nProceed with removing {len(bots_to_process)} bot followers?"):
                 self.logger.info("Removal cancelled by user")
                 return 0
         
-        # Re-navigate to followers page and scroll to top to start fresh
-        self.logger.info("Refreshing followers page before removal...")
-        if not await self.navigate_to_followers():
-            self.logger.error("Could not load followers page for removal")
-            return 0
-        await self.page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(1)
+        # The scan normally leaves us on the followers page already; only
+        # navigate if not, then scroll to top to start fresh
+        if self._on_followers_page():
+            self.logger.info("Already on followers page - skipping reload")
+        else:
+            self.logger.info("Loading followers page before removal...")
+            if not await self.navigate_to_followers():
+                self.logger.error("Could not load followers page for removal")
+                return 0
+        await self._scroll_to_top()
         
         # Process removals
-        self.logger.info(f"Starting removal of {len(bots_to_process)} bot followers...")
+        self.logger.info("Starting removal of %s bot followers...", len(bots_to_process))
         
         removed = 0
         failed = 0
         consecutive_failures = 0
+        batch_size = LIMITS["removal_batch_size"]
+        batch_results: Dict[str, Dict[str, bool]] = {}
         
         for i, bot in enumerate(bots_to_process, 1):
-            self.logger.info(f"[{i}/{len(bots_to_process)}] Processing @{bot.username}")
+            self.logger.info("[%s/%s] Processing @%s", i, len(bots_to_process), bot.username)
             
             # Check for page errors before each removal
             if await self._handle_page_error():
                 self.logger.info("Recovered from page error, continuing...")
                 await asyncio.sleep(2)
             
-            success = await self.remove_follower(bot.username)
+            # Remove the next batch's rendered rows in one page call
+            if (i - 1) % batch_size == 0:
+                batch = bots_to_process[i - 1:i - 1 + batch_size]
+                for _ in batch:
+                    await self.rate_limiter.acquire()
+                batch_results = await self._batch_remove([b.username for b in batch])
+            
+            result = batch_results.get(bot.username.lower(), {})
+            success = result.get("removed", False)
+            if not success:
+                # Not rendered or the menu misbehaved - scroll to it and retry step by step
+                success = await self.remove_follower(bot.username)
             
             if success:
                 bot.removed = True
                 removed += 1
                 self.removed_count += 1
                 consecutive_failures = 0
+                
+                # Let the list drop the row before looking for the next one.
+                # The batch helper already waited removal_settle for its rows,
+                # so only the step-by-step path needs to wait here.
+                if not result.get("removed", False):
+                    await self._wait_for_row_gone(bot.username)
+                elif not result.get("detached", False):
+                    self.logger.debug("Row for @%s still present after removal", bot.username)
             else:
                 bot.removal_error = "Failed to remove"
                 failed += 1
                 self.failed_count += 1
-                consecutive_failures += 1
                 
-                # If too many consecutive failures, refresh the page
-                if consecutive_failures >= 5:
-                    self.logger.warning("Multiple consecutive failures - refreshing page...")
-                    await self.navigate_to_followers()
-                    consecutive_failures = 0
+                # A follower missing from the list says nothing about the page
+                # or rate limits, so only menu/confirm failures count here
+                if not self._last_removal_not_found:
+                    consecutive_failures += 1
+                    
+                    # Circuit breaker: the page is probably wedged (stale menu,
+                    # error state) - capture it and start over from a fresh load
+                    if consecutive_failures >= LIMITS["circuit_breaker_failures"]:
+                        self.logger.warning(
+                            "%s consecutive failures - resetting followers page...", consecutive_failures
+                        )
+                        try:
+                            await self.take_screenshot("removal_failures")
+                        except Exception as e:
+                            self.logger.debug("Could not take screenshot: %s", e)
+                        await self.navigate_to_followers()
+                        # Fresh page, fresh streak - the reload was the pause
+                        consecutive_failures = 0
+                    elif i < len(bots_to_process):
+                        # Back off harder the longer the failure streak; resets on success
+                        delay = backoff_delay(consecutive_failures - 1)
+                        self.logger.info("Backing off %.1fs after failure", delay)
+                        await asyncio.sleep(delay)
             
             # Progress update
             if i % LIMITS["batch_size"] == 0:
                 self.logger.info(
-                    f"Batch progress: {removed} removed, {failed} failed "
-                    f"{format_progress(i, len(bots_to_process))}"
+                    "Batch progress: %s removed, %s failed %s",
+                    removed, failed, format_progress(i, len(bots_to_process))
                 )
-            
-            # Delay between removals
-            if i < len(bots_to_process):
-                await asyncio.sleep(DELAYS["between_removals"])
         
-        self.logger.info(f"✓ Removal complete: {removed} removed, {failed} failed")
+        self.logger.info("✓ Removal complete: %s removed, %s failed", removed, failed)
         return removed
     
+    async def _batch_remove(self, usernames: List[str]) -> Dict[str, Dict[str, bool]]:
+        """
+        Remove several rendered followers with a single page evaluation.
+        
+        Args:
+            usernames: Usernames to remove, in order
+            
+        Returns:
+            Dict of lowercase username -> {"removed": bool, "detached": bool}.
+            "detached" is whether the row left the list within removal_settle.
+            Followers whose rows weren't rendered map to removed False.
+        """
+        remove_texts = [
+            TEXT_PATTERNS["remove_follower"].lower(),
+            TEXT_PATTERNS["remove_follower_alt"].lower(),
+        ]
+        try:
+            return await self.page.evaluate(_BATCH_REMOVE_JS, [
+                SELECTORS["follower_cell"],
+                SELECTORS["user_name_link"],
+                self._menu_selector_cache or _MENU_BUTTON_SELECTOR_GROUP,
+                SELECTORS["menu_item"],
+                SELECTORS["confirm_button"],
+                remove_texts,
+                [username.lower() for username in usernames],
+                int(DELAYS["removal_settle"] * 1000),
+            ])
+        except Exception as e:
+            self.logger.debug("Batch removal failed: %s", e)
+            return {}
+    
+    async def _wait_for_row_gone(self, username: str) -> bool:
+        """
+        Wait for a removed follower's row to leave the list.
+        
+        Args:
+            username: Username of the removed follower
+            
+        Returns:
+            True if the row is gone, False if it was still there at the timeout
+        """
+        try:
+            await self.page.wait_for_function(
+                _ROW_GONE_JS,
+                arg=[SELECTORS["follower_cell"], SELECTORS["user_name_link"], username.lower()],
+                timeout=DELAYS["removal_settle"] * 1000
+            )
+            return True
+        except PlaywrightTimeout:
+            self.logger.debug("Row for @%s still present after removal", username)
+            return False
+    
+    def _end_session(self):
+        """Stamp the report with the session end time and duration."""
+        self.report.session_end = datetime.now().isoformat()
+        self.report.duration_seconds = round(time.monotonic() - self._session_t0, 1)
+    
     async def take_screenshot(self, name: str) -> str:
         """
         Take a screenshot for debugging.
@@ -913,10 +1730,15 @@ class TwitterCleaner:
         
         os.makedirs(OUTPUT["screenshots_dir"], exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = os.path.join(OUTPUT["screenshots_dir"], f"{name}_{timestamp}.png")
+        image_type = OUTPUT["screenshot_format"]
+        extension = "jpg" if image_type == "jpeg" else image_type
+        path = os.path.join(OUTPUT["screenshots_dir"], f"{name}_{timestamp}.{extension}")
         
-        await self.page.screenshot(path=path, full_page=True)
-        self.logger.info(f"Screenshot saved: {path}")
+        options = {"path": path, "type": image_type, "full_page": True}
+        if image_type == "jpeg":
+            options["quality"] = OUTPUT["screenshot_quality"]
+        await self.page.screenshot(**options)
+        self.logger.info("Screenshot saved: %s", path)
         
         return path
     
@@ -925,7 +1747,9 @@ class TwitterCleaner:
         dry_run: bool = False,
         limit: Optional[int] = None,
         skip_confirmation: bool = False,
-        from_end: bool = False
+        from_end: bool = False,
+        api_scan: bool = False,
+        write_csv: bool = False
     ) -> CleanupReport:
         """
         Run the full cleanup process using batch scan-and-remove approach.
@@ -935,6 +1759,9 @@ class TwitterCleaner:
             limit: Maximum number of followers to process/remove
             skip_confirmation: If True, skip confirmation prompts
             from_end: If True, start from the end of the followers list
+            api_scan: If True, read followers from API responses instead of
+                rendered cells, removing bots as each response arrives
+            write_csv: If True, also write the followers list as CSV
             
         Returns:
             CleanupReport with results
@@ -948,39 +1775,51 @@ class TwitterCleaner:
             
             # Confirmation before proceeding
             if not skip_confirmation:
-                if not confirm_action(f"Proceed with scanning followers for @{self.user_id}?", default=True):
+                if not await confirm_action_async(f"Proceed with scanning followers for @{self.user_id}?", default=True):
                     self.logger.info("Operation cancelled by user")
-                    self.report.session_end = datetime.now().isoformat()
+                    self._end_session()
                     return self.report
             
-            # Step 2: Navigate to followers
-            if not await self.navigate_to_followers():
-                raise RuntimeError("Failed to navigate to followers page")
-            
-            # Step 3: Scan and remove in batches (more efficient!)
-            # This scans visible followers and removes bots while they're still on screen
-            await self.scan_and_remove_in_batches(
-                dry_run=dry_run,
-                limit=limit,
-                require_confirmation=not skip_confirmation,
-                from_end=from_end
-            )
+            if api_scan:
+                # Steps 2-3: Read followers from API responses, removing each
+                # response's bots while their rows are rendered
+                await self.scan_via_api(
+                    dry_run=dry_run,
+                    removal_limit=limit,
+                    require_confirmation=not skip_confirmation
+                )
+            else:
+                # Step 2: Navigate to followers
+                if not await self.navigate_to_followers():
+                    raise RuntimeError("Failed to navigate to followers page")
+                
+                # Step 3: Scan and remove in batches (more efficient!)
+                # This scans visible followers and removes bots while they're still on screen
+                await self.scan_and_remove_in_batches(
+                    dry_run=dry_run,
+                    limit=limit,
+                    require_confirmation=not skip_confirmation,
+                    from_end=from_end
+                )
             
             # Update final stats
             self.report.total_followers_scanned = len(self.followers)
-            self.report.bot_accounts_identified = sum(1 for f in self.followers if f.is_bot)
+            self.report.bot_accounts_identified = self.bot_count
             self.report.successfully_removed = self.removed_count
             self.report.failed_removals = self.failed_count
-            self.report.followers = [asdict(f) for f in self.followers]
-            self.report.session_end = datetime.now().isoformat()
+            self._end_session()
             
             # Save report and backup
-            saved_files = save_report(self.report)
-            self.logger.info(f"Report saved: {saved_files}")
+            saved_files = save_report(
+                self.report,
+                format="both" if write_csv else "json",
+                followers=self.followers
+            )
+            self.logger.info("Report saved: %s", saved_files)
             
             if self.removed_count > 0:
                 backup_path = save_backup(self.followers, self.user_id)
-                self.logger.info(f"Backup saved: {backup_path}")
+                self.logger.info("Backup saved: %s", backup_path)
             
             # Print summary
             print_summary(self.report)
@@ -988,9 +1827,9 @@ class TwitterCleaner:
             return self.report
             
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
             self.report.errors.append(str(e))
-            self.report.session_end = datetime.now().isoformat()
+            self._end_session()
             
             # Take error screenshot
             try:
@@ -5,22 +5,36 @@ Includes bot detection, logging, and reporting helpers.
 
 from __future__ import annotations
 
+import asyncio
 import re
 import json
+import hashlib
 import csv
 import logging
 import os
+import sys
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Tuple
-from dataclasses import dataclass, asdict, field
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Set, Tuple
+from dataclasses import dataclass, field, fields
 
 from config import BOT_DETECTION, OUTPUT
 
+try:
+    import orjson  # optional: much faster report/backup serialization
+except ImportError:
+    orjson = None
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
-@dataclass
+# __slots__ drops the per-instance __dict__ (dataclass slots need 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class FollowerInfo:
     """Represents a Twitter follower."""
     username: str
@@ -29,14 +43,15 @@ class FollowerInfo:
     bot_reason: str = ""
     removed: bool = False
     removal_error: str = ""
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = ""  # when scanned; set once per batch by the caller
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CleanupReport:
     """Summary report of cleanup operation."""
     session_start: str
     session_end: str = ""
+    duration_seconds: Optional[float] = None  # monotonic, immune to clock changes
     user_id: str = ""
     total_followers_scanned: int = 0
     bot_accounts_identified: int = 0
@@ -50,6 +65,44 @@ class CleanupReport:
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that buffers writes instead of flushing after every record.
+    
+    The file is opened on first use with a large write buffer and flushed
+    every `flush_every` records, immediately for WARNING and above, and on
+    close (logging.shutdown closes handlers at exit).
+    """
+    
+    def __init__(self, filename: str, encoding: Optional[str] = None,
+                 buffer_size: int = 64 * 1024, flush_every: int = 100):
+        self.buffer_size = buffer_size
+        self.flush_every = flush_every
+        self._pending = 0
+        super().__init__(filename, encoding=encoding, delay=True)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=getattr(self, "errors", None))
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if record.levelno >= logging.WARNING or self._pending >= self.flush_every:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        super().flush()
+        self._pending = 0
+
+
 def setup_logging(verbose: bool = False) -> logging.Logger:
     """Configure logging with both file and console handlers."""
     # Create logs directory if needed
@@ -83,7 +136,7 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
     logger.addHandler(console_handler)
     
     # File handler
-    file_handler = logging.FileHandler(OUTPUT["log_file"], encoding='utf-8')
+    file_handler = BufferedFileHandler(OUTPUT["log_file"], encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
@@ -104,15 +157,90 @@ class ColoredFormatter(logging.Formatter):
     }
     
     def format(self, record):
-        color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
+        levelname = record.levelname
+        color = self.COLORS.get(levelname, self.COLORS['RESET'])
         reset = self.COLORS['RESET']
-        record.levelname = f"{color}{record.levelname}{reset}"
-        return super().format(record)
+        # The record is shared with other handlers (e.g. the log file), so
+        # only color it for the duration of this call
+        record.levelname = f"{color}{levelname}{reset}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 # =============================================================================
 # BOT DETECTION
 # =============================================================================
+def _trailing_digit_run(username: str) -> int:
+    """Count the consecutive digits at the end of a username."""
+    return len(username) - len(username.rstrip("0123456789"))
+
+
+# String checks equivalent to re.match(pattern, username) for the built-in
+# digit patterns. Twitter usernames are ASCII letters, digits and underscores,
+# so these never need the regex engine. Patterns not listed here (including
+# any added to config.py) still go through regex.
+_FAST_CHECKS = {
+    r".*\d{5,}$": lambda u: _trailing_digit_run(u) >= 5,
+    r"\d{6,}$": lambda u: len(u) >= 6 and _trailing_digit_run(u) == len(u),
+    r"^\d{8,}$": lambda u: len(u) >= 8 and _trailing_digit_run(u) == len(u),
+    r"_[12]\d{3}$": lambda u: len(u) == 5 and u[0] == "_" and u[1] in "12" and _trailing_digit_run(u) >= 4,
+    # The two lookahead patterns below are O(n^2) in the regex engine on
+    # long inputs; these are linear scans instead
+    r"^(?=[0-9a-f]*[0-9])(?=[0-9a-f]*[a-f])[0-9a-f]{12,}$": lambda u: (
+        len(u) >= 12 and not u.strip("0123456789abcdef")
+        and not u.isdigit() and not u.isalpha()  # all hex: needs a letter and a digit
+    ),
+    r"^(?=(?:.*\d){6,}).*$": lambda u: sum(map(u.count, "0123456789")) >= 6,
+}
+
+
+def _shift_backrefs(pattern: str, offset: int) -> str:
+    """Renumber \\N backreferences so a pattern still works inside a larger regex."""
+    return re.sub(
+        r"(?<!\\)((?:\\\\)*)\\([1-9]\d*)",
+        lambda m: f"{m.group(1)}\\{int(m.group(2)) + offset}",
+        pattern,
+    )
+
+
+def _build_union(indexed_patterns: List[Tuple[int, str]]) -> Optional[re.Pattern]:
+    """
+    Join patterns into one alternation, one named group per pattern.
+    
+    Group "p<i>" wraps the pattern at index i of _PATTERNS, so
+    match.lastgroup tells which one fired. Alternatives are tried left to
+    right, matching the order of the config list.
+    """
+    if not indexed_patterns:
+        return None
+    
+    parts = []
+    groups_before = 0
+    for index, pattern in indexed_patterns:
+        # +1 for the named group wrapping this pattern
+        parts.append(f"(?P<p{index}>{_shift_backrefs(pattern, groups_before + 1)})")
+        groups_before += 1 + re.compile(pattern).groups
+    return re.compile("|".join(parts))
+
+
+# Every bot pattern in priority order - the digit suffix first, then the
+# suspicious patterns in config order - with the reason reported for each
+_PATTERNS = (BOT_DETECTION["digit_suffix_pattern"], *BOT_DETECTION["suspicious_patterns"])
+_REASONS = (
+    "Username ends with 5+ consecutive digits",
+    *(f"Matches suspicious pattern: {p}" for p in BOT_DETECTION["suspicious_patterns"]),
+)
+
+_PATTERN_FAST = tuple((i, _FAST_CHECKS[p]) for i, p in enumerate(_PATTERNS) if p in _FAST_CHECKS)
+_PATTERN_UNION = _build_union([(i, p) for i, p in enumerate(_PATTERNS) if p not in _FAST_CHECKS])
+_PATTERN_UNION_FIRST = next((i for i, p in enumerate(_PATTERNS) if p not in _FAST_CHECKS), len(_PATTERNS))
+
+
+# Pure function of the username; scroll overlap, retries and re-scans hit
+# the same names again. Bounded so a huge account can't grow it unchecked.
+@lru_cache(maxsize=65536)
 def is_bot_username(username: str) -> tuple[bool, str]:
     """
     Check if a username matches bot patterns.
@@ -123,18 +251,42 @@ def is_bot_username(username: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_bot, reason)
     """
-    # Primary check: 3+ digits at end
-    if re.match(BOT_DETECTION["digit_suffix_pattern"], username):
-        return True, "Username ends with 5+ consecutive digits"
-    
-    # Additional suspicious patterns
-    for pattern in BOT_DETECTION.get("suspicious_patterns", []):
-        if re.match(pattern, username):
-            return True, f"Matches suspicious pattern: {pattern}"
+    # The string checks are cheap, so find the first of those that hits...
+    first_hit = len(_PATTERNS)
+    for index, check in _PATTERN_FAST:
+        if check(username):
+            first_hit = index
+            break
+    
+    # ...then one pass over the regex union, only if a regex pattern comes
+    # before that hit in priority order
+    if first_hit > _PATTERN_UNION_FIRST:
+        match = _PATTERN_UNION.match(username)
+        if match:
+            first_hit = min(first_hit, int(match.lastgroup[1:]))
+    
+    if first_hit < len(_PATTERNS):
+        return True, _REASONS[first_hit]
     
     return False, ""
 
 
+def classify_batch(usernames: Iterable[str]) -> List[Tuple[bool, str]]:
+    """
+    Classify a batch of usernames in one call.
+    
+    Args:
+        usernames: Twitter usernames to check (without @)
+        
+    Returns:
+        (is_bot, reason) for each username, in order
+    """
+    return list(map(is_bot_username, usernames))
+
+
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+
+
 def extract_username_from_text(text: str) -> Optional[str]:
     """
     Extract username from text that may contain @ prefix.
@@ -152,7 +304,7 @@ def extract_username_from_text(text: str) -> Optional[str]:
     username = text.strip().lstrip('@')
     
     # Validate it looks like a username (alphanumeric + underscore)
-    if re.match(r'^[a-zA-Z0-9_]+$', username):
+    if _USERNAME_RE.match(username):
         return username
     
     return None
@@ -163,17 +315,54 @@ def extract_username_from_text(text: str) -> Optional[str]:
 # =============================================================================
 def ensure_directories():
     """Create necessary output directories."""
-    for dir_path in [OUTPUT["reports_dir"], OUTPUT["screenshots_dir"], OUTPUT["backup_dir"]]:
+    for dir_path in [OUTPUT["reports_dir"], OUTPUT["screenshots_dir"], OUTPUT["backup_dir"], OUTPUT["cache_dir"]]:
         os.makedirs(dir_path, exist_ok=True)
 
 
-def save_report(report: CleanupReport, format: str = "both") -> Dict[str, str]:
+def _json_dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize to JSON text with orjson when installed, else the stdlib encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+_FOLLOWER_FIELDS = tuple(f.name for f in fields(FollowerInfo))
+
+
+def _follower_rows(followers: Iterable[FollowerInfo]) -> Iterator[Dict[str, Any]]:
+    """Yield one flat dict per follower, built only as it's written."""
+    for follower in followers:
+        yield {name: getattr(follower, name) for name in _FOLLOWER_FIELDS}
+
+
+def _write_report_json(f, header: Dict[str, Any], rows: Iterable[Dict[str, Any]]):
+    """Write the report as indented JSON, streaming the followers array row by row."""
+    head = _json_dumps(header)
+    f.write(head[:-2])  # reopen the object: drop the closing "\n}"
+    f.write(',\n  "followers": [')
+    
+    sep = "\n"
+    for row in rows:
+        f.write(sep)
+        f.write("    " + _json_dumps(row).replace("\n", "\n    "))
+        sep = ",\n"
+    
+    f.write("\n  ]\n}" if sep != "\n" else "]\n}")
+
+
+def save_report(
+    report: CleanupReport,
+    format: str = "json",
+    followers: Optional[List[FollowerInfo]] = None
+) -> Dict[str, str]:
     """
     Save cleanup report to file.
     
     Args:
         report: CleanupReport instance
         format: "json", "csv", or "both"
+        followers: Followers to write, streamed straight from the dataclasses.
+            Defaults to report.followers (already converted to dicts).
         
     Returns:
         Dict with file paths
@@ -184,23 +373,32 @@ def save_report(report: CleanupReport, format: str = "both") -> Dict[str, str]:
     base_name = f"cleanup_report_{report.user_id}_{timestamp}"
     saved_files = {}
     
-    # Convert report to dict
-    report_dict = asdict(report)
+    def rows():
+        return _follower_rows(followers) if followers is not None else iter(report.followers)
+    
+    # Everything but the followers list, which is written separately
+    header = {
+        name: getattr(report, name)
+        for name in (f.name for f in fields(CleanupReport))
+        if name != "followers"
+    }
     
     # Save JSON
     if format in ("json", "both"):
         json_path = os.path.join(OUTPUT["reports_dir"], f"{base_name}.json")
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(report_dict, f, indent=2, ensure_ascii=False)
+            _write_report_json(f, header, rows())
         saved_files["json"] = json_path
     
     # Save CSV (followers list)
-    if format in ("csv", "both") and report.followers:
+    has_followers = bool(followers) if followers is not None else bool(report.followers)
+    if format in ("csv", "both") and has_followers:
         csv_path = os.path.join(OUTPUT["reports_dir"], f"{base_name}_followers.csv")
         with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=report.followers[0].keys())
+            writer = csv.DictWriter(f, fieldnames=_FOLLOWER_FIELDS)
             writer.writeheader()
-            writer.writerows(report.followers)
+            for row in rows():
+                writer.writerow(row)
         saved_files["csv"] = csv_path
     
     return saved_files
@@ -228,21 +426,80 @@ def save_backup(followers: List[FollowerInfo], user_id: str) -> str:
     backup_data = {
         "user_id": user_id,
         "timestamp": datetime.now().isoformat(),
-        "followers": [asdict(f) for f in followers if f.removed]
+        "followers": list(_follower_rows(f for f in followers if f.removed))
     }
     
     with open(backup_path, 'w', encoding='utf-8') as f:
-        json.dump(backup_data, f, indent=2, ensure_ascii=False)
+        f.write(_json_dumps(backup_data))
     
     return backup_path
 
 
+# =============================================================================
+# SCAN CACHE
+# =============================================================================
+def _patterns_fingerprint() -> str:
+    """Hash of the bot detection config; a cache is only valid for the patterns it was built with."""
+    raw = json.dumps(BOT_DETECTION, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _known_good_path(user_id: str) -> str:
+    return os.path.join(OUTPUT["cache_dir"], f"known_good_{user_id}.json")
+
+
+def load_known_good(user_id: str) -> Set[str]:
+    """
+    Load followers classified as non-bots on earlier runs.
+    
+    Args:
+        user_id: Twitter user ID the cache belongs to
+        
+    Returns:
+        Set of usernames, empty if there is no cache or it was built
+        with different bot detection patterns
+    """
+    try:
+        with open(_known_good_path(user_id), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    
+    if data.get("fingerprint") != _patterns_fingerprint():
+        return set()
+    return set(data.get("usernames", []))
+
+
+def save_known_good(user_id: str, usernames: Iterable[str]) -> str:
+    """
+    Save followers classified as non-bots for the next run.
+    
+    Args:
+        user_id: Twitter user ID the cache belongs to
+        usernames: Non-bot usernames
+        
+    Returns:
+        Path to cache file
+    """
+    ensure_directories()
+    
+    cache_path = _known_good_path(user_id)
+    cache_data = {
+        "fingerprint": _patterns_fingerprint(),
+        "timestamp": datetime.now().isoformat(),
+        "usernames": sorted(usernames)
+    }
+    
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        f.write(_json_dumps(cache_data, indent=False))
+    
+    return cache_path
+
+
 # =============================================================================
 # DISPLAY HELPERS
 # =============================================================================
-def print_banner():
-    """Display application banner."""
-    banner = """
+_BANNER = """
 ╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
 ║          🧹 Twitter Follower Cleanup Tool 🧹                  ║
@@ -252,26 +509,57 @@ def print_banner():
 ║                                                               ║
 ╚═══════════════════════════════════════════════════════════════╝
 """
-    print(banner)
-
 
-def print_summary(report: CleanupReport):
-    """Print formatted summary of cleanup operation."""
-    mode = "DRY RUN" if report.dry_run else "LIVE"
-    
-    summary = f"""
+# 63 columns between the borders; values are padded to the right border
+_SUMMARY_TMPL = """
 ┌───────────────────────────────────────────────────────────────┐
-│                    CLEANUP SUMMARY ({mode})                   
+│{title:^63}│
 ├───────────────────────────────────────────────────────────────┤
-│  User ID:                    @{report.user_id:<28}│
-│  Total Followers Scanned:    {report.total_followers_scanned:<30}│
-│  Bot Accounts Identified:    {report.bot_accounts_identified:<30}│
-│  Successfully Removed:       {report.successfully_removed:<30}│
-│  Failed Removals:            {report.failed_removals:<30}│
-│  Session Duration:           {calculate_duration(report.session_start, report.session_end):<30}│
+│  User ID:                    {user_id:<33}│
+│  Total Followers Scanned:    {scanned:<33}│
+│  Bot Accounts Identified:    {bots:<33}│
+│  Successfully Removed:       {removed:<33}│
+│  Failed Removals:            {failed:<33}│
+│  Session Duration:           {duration:<33}│
 └───────────────────────────────────────────────────────────────┘
 """
-    print(summary)
+
+
+def print_banner():
+    """Display application banner."""
+    print(_BANNER)
+
+
+def print_summary(report: CleanupReport):
+    """Print formatted summary of cleanup operation."""
+    mode = "DRY RUN" if report.dry_run else "LIVE"
+    if report.duration_seconds is not None:
+        duration = format_duration(report.duration_seconds)
+    else:
+        duration = calculate_duration(report.session_start, report.session_end)
+    
+    print(_SUMMARY_TMPL.format_map({
+        "title": f"CLEANUP SUMMARY ({mode})",
+        "user_id": f"@{report.user_id}",
+        "scanned": report.total_followers_scanned,
+        "bots": report.bot_accounts_identified,
+        "removed": report.successfully_removed,
+        "failed": report.failed_removals,
+        "duration": duration,
+    }))
+
+
+def format_duration(total_seconds: float) -> str:
+    """Format a number of seconds as a human-readable duration."""
+    minutes, seconds = divmod(int(total_seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    else:
+        return f"{seconds}s"
 
 
 def calculate_duration(start: str, end: str) -> str:
@@ -279,30 +567,27 @@ def calculate_duration(start: str, end: str) -> str:
     try:
         start_dt = datetime.fromisoformat(start)
         end_dt = datetime.fromisoformat(end) if end else datetime.now()
-        delta = end_dt - start_dt
-        
-        minutes, seconds = divmod(int(delta.total_seconds()), 60)
-        hours, minutes = divmod(minutes, 60)
-        
-        if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
+        return format_duration((end_dt - start_dt).total_seconds())
     except Exception:
         return "N/A"
 
 
+# Built once; progress bars are slices of these
+_BAR_MAX_WIDTH = 100
+_BAR_FULL = "█" * _BAR_MAX_WIDTH
+_BAR_EMPTY = "░" * _BAR_MAX_WIDTH
+_BAR_DONE = "=" * _BAR_MAX_WIDTH
+
+
 def format_progress(current: int, total: int, width: int = 30) -> str:
     """Create a text-based progress bar."""
+    width = min(width, _BAR_MAX_WIDTH)
     if total == 0:
-        return "[" + "=" * width + "] 100%"
+        return "[" + _BAR_DONE[:width] + "] 100%"
     
     percent = current / total
-    filled = int(width * percent)
-    bar = "█" * filled + "░" * (width - filled)
-    return f"[{bar}] {percent*100:.1f}%"
+    filled = max(0, min(width, int(width * percent)))
+    return f"[{_BAR_FULL[:filled]}{_BAR_EMPTY[:width - filled]}] {percent*100:.1f}%"
 
 
 def confirm_action(message: str, default: bool = False) -> bool:
@@ -324,3 +609,40 @@ def confirm_action(message: str, default: bool = False) -> bool:
     
     return response in ('y', 'yes')
 
+
+async def confirm_action_async(message: str, default: bool = False) -> bool:
+    """
+    Prompt user for confirmation without blocking the event loop.
+    
+    input() runs in a worker thread, so the browser connection and any
+    background tasks keep being serviced while the prompt is up. The thread
+    is a daemon rather than an executor worker: executors are joined on
+    shutdown, which would make Ctrl+C at the prompt hang until Enter.
+    
+    Args:
+        message: Confirmation message to display
+        default: Default response if user just presses Enter
+        
+    Returns:
+        True if confirmed, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def settle(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def prompt():
+        try:
+            outcome = (future.set_result, confirm_action(message, default))
+        except Exception as e:  # e.g. EOFError when stdin is closed
+            outcome = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # loop already closed
+    
+    threading.Thread(target=prompt, name="confirm-prompt", daemon=True).start()
+    return await future
+